@@ -5,22 +5,29 @@ Fetches raw race data from DATA_SOURCE_URL on each interval, processes it fully
 (sorting, grouping, gap calculation, position tracking), then pushes per-competitor
 and per-distance update messages to all connected WebSocket clients.
 
-WebSocket message types (backend → frontend):
-  status            — sent on connect: { data_source_url, data_source_interval }
-  event_name        — { name }
-  error             — human-readable error string
-  distance_meta     — scalar fields for one distance (sent when any field changes)
-  competitor_update — one message per changed competitor
+WebSocket message types (backend → frontend), msgpack-encoded binary frames:
+  status             — sent on connect: { data_source_url, data_source_interval }
+  snapshot           — sent on connect after status: { name, distances, competitors }
+                       (full replay of the latest state in a single frame)
+  event_name         — { name }
+  error              — human-readable error string
+  distance_meta      — scalar fields for one distance (sent when any field changes)
+  competitor_updates — list of changed competitors, one message per fetch cycle
 """
 
 import asyncio
+import hashlib
 import os
-import re
 import logging
-from contextlib import asynccontextmanager
+from collections import defaultdict
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from operator import itemgetter
 
 import httpx
-from aiocache import Cache
+import msgpack
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 
 logging.basicConfig(level=logging.INFO)
@@ -30,25 +37,50 @@ logger = logging.getLogger(__name__)
 DATA_SOURCE_URL = os.environ.get("DATA_SOURCE_URL", "http://localhost:8080/api/data")
 DATA_SOURCE_INTERVAL = float(os.environ.get("DATA_SOURCE_INTERVAL", "1"))
 
-cache = Cache(Cache.MEMORY)
+SEND_TIMEOUT = 5.0  # seconds per client send before the client is dropped
+SEND_QUEUE_SIZE = 256  # frames buffered per client before it is dropped as stalled
+
+# latest processed state by key — the single store diffed against every tick and
+# replayed to connecting clients; a plain dict, so a client can take its snapshot
+# and be registered for broadcasts without yielding in between
+cache: dict[str, object] = {}
+
+# distance title metadata, e.g. "Mass start 16 ronden" / "500 meter"
+_LAP_WORDS = ("lap", "ronde")  # lap, laps / ronde, ronden, rondes
+
+_lap_time_key = itemgetter("time")
 
 # ── time helpers ──────────────────────────────────────────────────────────────
+# Both helpers are pure and see the same lap/total time strings every tick,
+# so results are memoized per input string.
 
+@lru_cache(maxsize=4096)
 def _parse_seconds(t: str) -> float:
     if not t:
         return 0.0
-    parts = t.split(":")
-    if len(parts) == 3:
-        return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-    if len(parts) == 2:
-        return int(parts[0]) * 60 + float(parts[1])
-    return float(parts[0])
+    # [[H:]M:]S[.fff] — locate the separators instead of splitting into a list
+    c1 = t.find(":")
+    if c1 == -1:
+        return float(t)
+    c2 = t.find(":", c1 + 1)
+    if c2 == -1:
+        return int(t[:c1]) * 60 + float(t[c1 + 1:])
+    return int(t[:c1]) * 3600 + int(t[c1 + 1:c2]) * 60 + float(t[c2 + 1:])
 
 
+@lru_cache(maxsize=4096)
 def _format_time(t: str) -> str:
     """Strip leading zeros, truncate to 3 decimal places."""
     if not t:
         return ""
+    # fast path for the source's usual zero-padded "HH:MM:SS.fffffff" layout
+    if len(t) > 8 and t[2] == ":" and t[5] == ":" and t[8] == ".":
+        h, m, sec, frac = int(t[:2]), int(t[3:5]), t[6:8], t[9:12]
+        if h:
+            return f"{h}:{m}:{sec}.{frac}"
+        if m:
+            return f"{m}:{sec}.{frac}"
+        return f"{sec.lstrip('0') or '0'}.{frac}"
     colon_parts = t.split(":")
     result: list[str] = []
     found_nonzero = False
@@ -76,21 +108,108 @@ def _format_time(t: str) -> str:
 
 # ── data processing ───────────────────────────────────────────────────────────
 
-def _process(raw: dict) -> dict:
+@dataclass(slots=True)
+class CompetitorRow:
+    """One processed competitor — the `competitor_update` payload (packed as a map of its slots)."""
+    start_number: str
+    name: str
+    laps_count: int
+    total_time: str
+    id: str
+    distance_id: str
+    category: str | None
+    heat: int
+    lane: str
+    formatted_total_time: str
+    lap_times: tuple[str, ...]
+    personal_record: str | None
+    laps_remaining: int | None
+    finished_rank: int | None
+    invalid_reason: str | None
+    remark: str | None
+
+
+def _parse_name_meta(name: str) -> tuple[int | None, int | None]:
+    """
+    Extract (laps, meters) from a distance title in a single scan: the first
+    number followed by a lap keyword, and the first followed by a meter unit
+    ("m" as a whole word, or "meter..."). Case-insensitive.
+    """
+    laps = meters = None
+    n = len(name)
+    i = 0
+    while i < n and (laps is None or meters is None):
+        if not name[i].isdecimal():
+            i += 1
+            continue
+        j = i
+        while j < n and name[j].isdecimal():
+            j += 1
+        k = j
+        while k < n and name[k].isspace():
+            k += 1
+        w = k
+        while w < n and (name[w].isalnum() or name[w] == "_"):
+            w += 1
+        word = name[k:w].lower()
+        if laps is None and word.startswith(_LAP_WORDS):
+            laps = int(name[i:j])
+        if meters is None and (word == "m" or word.startswith("meter")):
+            meters = int(name[i:j])
+        i = j
+    return laps, meters
+
+
+@lru_cache(maxsize=256)
+def _title_meta(name: str, is_mass_start: bool) -> tuple[int | None, int | None]:
+    """
+    Extract (total_laps, distance_meters) from a distance title.
+    Titles are stable within an event, so results are memoized per title.
+    """
+    laps, meters = _parse_name_meta(name)
+    return (laps, None) if is_mass_start else (None, meters)
+
+
+def _process(raw: dict, prev: dict | None = None) -> dict:
     """
     Parse raw source data into fully computed dashboard state.
+    Distance and competitor dicts equal to those in prev (the previous result)
+    are replaced by the previous objects, so unchanged entities keep their
+    identity across ticks; a distance whose competitors are all unchanged keeps
+    the previous competitors mapping itself. Distances whose raw dict is
+    unchanged, and competitors whose raw race is unchanged, are not rebuilt at
+    all. When nothing changed at all, prev itself is returned.
     Returns:
       {
         "name": str,
         "distances": { dist_id: <distance_meta> },
         "competitors": { dist_id: { race_id: <competitor_update> } },
+        "sources": { dist_id: { race_id: <raw race> } },
+        "raw_distances": { dist_id: <raw distance> },
       }
     """
     distances_out: dict[str, dict] = {}
-    competitors_out: dict[str, dict[str, dict]] = {}
+    competitors_out: dict[str, dict[str, CompetitorRow]] = {}
+    prev_distances: dict[str, dict] = prev["distances"] if prev else {}
+    prev_competitors: dict[str, dict[str, CompetitorRow]] = prev["competitors"] if prev else {}
+    prev_sources: dict[str, dict[str, dict]] = prev["sources"] if prev else {}
+    prev_raw_distances: dict[str, dict] = prev["raw_distances"] if prev else {}
+    sources_out: dict[str, dict[str, dict]] = {}
+    raw_distances_out: dict[str, dict] = {}
+    unchanged = prev is not None and raw.get("name", "") == prev["name"]
 
     for dist in raw.get("distances", []):
         dist_id = dist["id"]
+        raw_distances_out[dist_id] = dist
+
+        # raw distance unchanged (typically a completed one) — its output only
+        # depends on the raw distance, so carry over the whole subtree as-is
+        if dist_id in prev_distances and prev_raw_distances.get(dist_id) == dist:
+            distances_out[dist_id] = prev_distances[dist_id]
+            competitors_out[dist_id] = prev_competitors[dist_id]
+            sources_out[dist_id] = prev_sources[dist_id]
+            continue
+
         races = dist.get("races", [])
 
         # mass start: >2 races all in same heat
@@ -100,82 +219,91 @@ def _process(raw: dict) -> dict:
         )
 
         # extract metadata from title
-        total_laps: int | None = None
-        distance_meters: int | None = None
-        if is_mass_start:
-            m = re.search(r"(\d+)\s*(?:laps?|ronden?|rondes?)", dist["name"], re.IGNORECASE)
-            if m:
-                total_laps = int(m.group(1))
-        else:
-            m = re.search(r"(\d+)\s*(?:m\b|meter)", dist["name"], re.IGNORECASE)
-            if m:
-                distance_meters = int(m.group(1))
+        total_laps, distance_meters = _title_meta(dist["name"], is_mass_start)
+
+        # competitors may only be carried over when the distance context is the same
+        prev_dist = prev_distances.get(dist_id)
+        same_context = (
+            prev_dist is not None
+            and prev_dist["is_mass_start"] == is_mass_start
+            and prev_dist["total_laps"] == total_laps
+        )
+        prev_comps = prev_competitors.get(dist_id, {})
+        prev_races = prev_sources.get(dist_id, {}) if same_context else {}
+        sources_out[dist_id] = {race["id"]: race for race in races}
 
         # per-competitor base processing
-        processed: list[dict] = []
+        processed: list[CompetitorRow] = []
         for race in races:
-            laps = list(race.get("laps") or [])
+            prev_comp = prev_comps.get(race["id"])
+            if prev_comp is not None and prev_races.get(race["id"]) == race:
+                processed.append(prev_comp)  # raw race unchanged — reuse as-is
+                continue
+
+            laps = race.get("laps") or []
             if is_mass_start and laps:
                 laps = laps[1:]  # omit warmup
 
             total_time = ""
             formatted_total_time = ""
             if laps:
-                total_time = sorted(laps, key=lambda l: l["time"])[-1]["time"]
+                total_time = max(laps, key=_lap_time_key)["time"]
                 formatted_total_time = _format_time(total_time)
 
             lane = "black" if is_mass_start else (race.get("lane") or "black")
-            lap_times = [_format_time(lap.get("lapTime", "")) for lap in laps]
+            lap_times = tuple(_format_time(lap.get("lapTime", "")) for lap in laps)
             raw_pr = race.get("personalRecord") or ""
             personal_record = _format_time(raw_pr) if raw_pr else None
 
             invalid_reason = race.get("invalidReason") or None
             remark = race.get("remark") or None
-
-            processed.append({
-                "start_number": race["competitor"]["startNumber"],
-                "name": race["competitor"]["name"],
-                "laps_count": len(laps),
-                "total_time": total_time,
-                "id": race["id"],
-                "distance_id": dist_id,
-                "category": race["competitor"].get("category") or None,
-                "heat": race["heat"],
-                "lane": lane,
-                "formatted_total_time": formatted_total_time,
-                "lap_times": lap_times,
-                "personal_record": personal_record,
-                "laps_remaining": None,
-                "finished_rank": None,
-                "invalid_reason": invalid_reason,
-                "remark": remark,
-            })
+            laps_remaining = (
+                max(0, total_laps - len(laps)) if is_mass_start and total_laps else None
+            )
+
+            processed.append(CompetitorRow(
+                start_number=race["competitor"]["startNumber"],
+                name=race["competitor"]["name"],
+                laps_count=len(laps),
+                total_time=total_time,
+                id=race["id"],
+                distance_id=dist_id,
+                category=race["competitor"].get("category") or None,
+                heat=race["heat"],
+                lane=lane,
+                formatted_total_time=formatted_total_time,
+                lap_times=lap_times,
+                personal_record=personal_record,
+                laps_remaining=laps_remaining,
+                finished_rank=None,
+                invalid_reason=invalid_reason,
+                remark=remark,
+            ))
 
         # sort: laps desc, time asc — stable ordering for broadcast sequence only, not sent to frontend
-        processed.sort(key=lambda r: (-r["laps_count"], _parse_seconds(r["total_time"]) if r["total_time"] else float("inf")))
+        processed.sort(key=lambda r: (-r.laps_count, _parse_seconds(r.total_time) if r.total_time else float("inf")))
 
-        # mass-start specific
+        # mass-start specific: finished competitors (laps_remaining == 0) form a
+        # prefix of the laps-desc ordering, so ranking stops at the first unfinished
         any_finished = False
-
-
         if is_mass_start and total_laps:
-            finish_rank = 1
-            for r in processed:
-                r["laps_remaining"] = max(0, total_laps - r["laps_count"])
-                if r["laps_remaining"] == 0:
-                    r["finished_rank"] = finish_rank
-                    finish_rank += 1
-                    any_finished = True
+            for i, r in enumerate(processed):
+                if r.laps_remaining != 0:
+                    break
+                if r.finished_rank != i + 1:
+                    # copy rather than mutate: r may be a row carried over from prev
+                    processed[i] = replace(r, finished_rank=i + 1)
+                any_finished = True
 
         # non-mass heat groups
         heat_groups: list[dict] = []
         if not is_mass_start:
-            heat_map: dict[int, list[str]] = {}
+            heat_map: defaultdict[int, list[str]] = defaultdict(list)
             for r in processed:
-                heat_map.setdefault(r["heat"], []).append(r["id"])
-            heat_groups = [{"heat": h, "race_ids": heat_map[h]} for h in sorted(heat_map)]
+                heat_map[r.heat].append(r.id)
+            heat_groups = [{"heat": h, "race_ids": ids} for h, ids in sorted(heat_map.items())]
 
-        distances_out[dist_id] = {
+        dist_out = {
             "id": dist_id,
             "name": dist["name"],
             "event_number": dist.get("eventNumber", 0),
@@ -186,35 +314,109 @@ def _process(raw: dict) -> dict:
             "any_finished": any_finished,
             "heat_groups": heat_groups,
         }
-        competitors_out[dist_id] = {r["id"]: r for r in processed}
+        if prev_dist == dist_out:
+            distances_out[dist_id] = prev_dist
+        else:
+            distances_out[dist_id] = dist_out
+            unchanged = False
+
+        comps_out: dict[str, CompetitorRow] = {}
+        comps_changed = len(processed) != len(prev_comps)
+        for r in processed:
+            prev_comp = prev_comps.get(r.id)
+            if prev_comp is r or prev_comp == r:
+                comps_out[r.id] = prev_comp
+            else:
+                comps_out[r.id] = r
+                comps_changed = True
+        if comps_changed:
+            competitors_out[dist_id] = comps_out
+            unchanged = False
+        else:
+            competitors_out[dist_id] = prev_comps  # whole subtree unchanged — keep identity
+
+    if unchanged and len(distances_out) == len(prev_distances):
+        return prev
 
     return {
         "name": raw.get("name", ""),
         "distances": distances_out,
         "competitors": competitors_out,
+        "sources": sources_out,
+        "raw_distances": raw_distances_out,
     }
 
 
-async def _update_cache_and_diff(curr: dict) -> tuple[bool, bool, list[dict], list[dict]]:
+def _fingerprint(obj) -> int:
+    """Structural hash of a processed distance/competitor (rows, dicts, lists, scalars)."""
+    if isinstance(obj, CompetitorRow):
+        return hash(tuple(getattr(obj, f) for f in CompetitorRow.__slots__))
+    if isinstance(obj, dict):
+        return hash(tuple((k, _fingerprint(v)) for k, v in obj.items()))
+    if isinstance(obj, list):
+        return hash(tuple(_fingerprint(v) for v in obj))
+    return hash(obj)
+
+
+# cache key → (object known equal to the cached value, its fingerprint)
+_cached_entries: dict[str, tuple[dict | CompetitorRow, int]] = {}
+
+
+def _changed_fingerprint(key: str, obj: dict | CompetitorRow) -> int | None:
+    """
+    None when obj is, or fingerprints equal to, the value cached under key.
+    Otherwise obj's fingerprint, to hand to _remember once obj is diffed.
+    """
+    entry = _cached_entries.get(key)
+    if entry is not None and entry[0] is obj:
+        return None
+    fp = _fingerprint(obj)
+    if entry is not None and entry[1] == fp:
+        _cached_entries[key] = (obj, fp)
+        return None
+    return fp
+
+
+def _remember(key: str, obj: dict | CompetitorRow, fp: int) -> None:
+    _cached_entries[key] = (obj, fp)
+
+
+# dist_id → (competitors mapping last diffed, race ids it contributed for replay)
+_diffed_comps: dict[str, tuple[dict, list[str]]] = {}
+
+
+def _comps_unchanged(dist_id: str, comps: dict) -> bool:
+    entry = _diffed_comps.get(dist_id)
+    return entry is not None and entry[0] is comps
+
+
+def _update_cache_and_diff(curr: dict) -> tuple[bool, bool, list[dict], list[CompetitorRow]]:
     """
     Compare curr against per-race cached entries. Update cache for anything
     that changed. Returns (reset_detected, name_changed, changed_distance_metas, changed_competitor_updates).
 
     A reset is detected when any competitor's laps_count is lower than the
     cached value — laps can never go backwards in a normal race.
+
+    Entities that are the very object cached last tick (reused by _process), or
+    whose fingerprint matches the cached one, are skipped without a deep
+    comparison. A distance whose competitors mapping is the
+    same object as last tick is skipped as a whole.
     """
     dist_updates: list[dict] = []
-    comp_updates: list[dict] = []
+    comp_updates: list[CompetitorRow] = []
 
     # ── reset detection ───────────────────────────────────────────────────────
     reset_detected = False
     for dist_id, comps in curr["competitors"].items():
+        if _comps_unchanged(dist_id, comps):
+            continue  # already checked against the same cache last tick
         for race_id, comp in comps.items():
-            prev = await cache.get(f"race:{race_id}")
-            if prev and comp["laps_count"] < prev["laps_count"]:
+            prev = cache.get(f"race:{race_id}")
+            if prev and comp.laps_count < prev.laps_count:
                 logger.warning(
                     "Reset detected: %s laps %d → %d — clearing cache",
-                    comp["name"], prev["laps_count"], comp["laps_count"],
+                    comp.name, prev.laps_count, comp.laps_count,
                 )
                 reset_detected = True
                 break
@@ -222,84 +424,147 @@ async def _update_cache_and_diff(curr: dict) -> tuple[bool, bool, list[dict], li
             break
 
     if reset_detected:
-        await cache.clear()
+        cache.clear()
+        _cached_entries.clear()
+        _diffed_comps.clear()
 
-    prev_name = await cache.get("event_name")
+    prev_name = cache.get("event_name")
     name_changed = curr["name"] != prev_name
     if name_changed:
-        await cache.set("event_name", curr["name"])
+        cache["event_name"] = curr["name"]
 
     all_race_ids: list[str] = []
     for dist_id, dist in curr["distances"].items():
-        prev_dist = await cache.get(f"dist:{dist_id}")
-        if prev_dist != dist:
-            await cache.set(f"dist:{dist_id}", dist)
-            dist_updates.append(dist)
-
-        for race_id, comp in curr["competitors"].get(dist_id, {}).items():
-            prev_comp = await cache.get(f"race:{race_id}")
-            if prev_comp == comp:
+        dist_key = f"dist:{dist_id}"
+        fp = _changed_fingerprint(dist_key, dist)
+        if fp is not None:
+            prev_dist = cache.get(dist_key)
+            if prev_dist != dist:
+                cache[dist_key] = dist
+                dist_updates.append(dist)
+            _remember(dist_key, dist, fp)
+
+        comps = curr["competitors"].get(dist_id, {})
+        if _comps_unchanged(dist_id, comps):
+            all_race_ids.extend(_diffed_comps[dist_id][1])
+            continue
+        dist_race_ids_start = len(all_race_ids)
+        for race_id, comp in comps.items():
+            race_key = f"race:{race_id}"
+            fp = _changed_fingerprint(race_key, comp)
+            if fp is None:
                 all_race_ids.append(race_id)  # unchanged — still track for replay
                 continue
+            prev_comp = cache.get(race_key)
+            if prev_comp == comp:
+                _remember(race_key, comp, fp)
+                all_race_ids.append(race_id)
+                continue
             is_new = prev_comp is None
-            if not comp.get("total_time") and not is_new:
-                if (comp.get("invalid_reason") == prev_comp.get("invalid_reason")
-                        and comp.get("remark") == prev_comp.get("remark")):
+            if not comp.total_time and not is_new:
+                if (comp.invalid_reason == prev_comp.invalid_reason
+                        and comp.remark == prev_comp.remark):
                     continue  # suppress no-time updates after initial appearance
-            await cache.set(f"race:{race_id}", comp)
+            cache[race_key] = comp
+            _remember(race_key, comp, fp)
             comp_updates.append(comp)
             all_race_ids.append(race_id)
+        _diffed_comps[dist_id] = (comps, all_race_ids[dist_race_ids_start:])
 
-    await cache.set("all_dist_ids", list(curr["distances"].keys()))
-    await cache.set("all_race_ids", all_race_ids)
+    cache["all_dist_ids"] = list(curr["distances"].keys())
+    cache["all_race_ids"] = all_race_ids
 
     return reset_detected, name_changed, dist_updates, comp_updates
 
 
 # ── WebSocket connection manager ──────────────────────────────────────────────
 
+def _pack_default(obj):
+    if isinstance(obj, CompetitorRow):
+        return {f: getattr(obj, f) for f in CompetitorRow.__slots__}
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def _encode(msg: dict) -> bytes:
+    """Serialize a message once so it can be sent as-is to every client."""
+    return msgpack.packb(msg, default=_pack_default, use_bin_type=True)
+
+
+def _snapshot() -> dict:
+    """Latest cached state, as replayed to a connecting client."""
+    dists = (cache.get(f"dist:{d}") for d in cache.get("all_dist_ids", []))
+    comps = (cache.get(f"race:{r}") for r in cache.get("all_race_ids", []))
+    return {
+        "name": cache["event_name"],
+        "distances": [d for d in dists if d],
+        "competitors": [c for c in comps if c],
+    }
+
+
 class ConnectionManager:
+    """
+    Each client gets a bounded frame queue drained by its own writer task, so a
+    slow client only delays itself. A client whose queue overflows is dropped
+    and closed; it reconnects and resyncs from a fresh snapshot.
+    """
+
     def __init__(self) -> None:
-        self.active: list[WebSocket] = []
+        self.active: dict[WebSocket, asyncio.Queue[bytes]] = {}
+        self._writers: dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, ws: WebSocket) -> None:
         await ws.accept()
-        self.active.append(ws)
-        logger.info("Client connected. Active: %d", len(self.active))
-
-        await ws.send_json({
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        queue.put_nowait(_encode({
             "type": "status",
             "data": {
                 "data_source_url": DATA_SOURCE_URL,
                 "data_source_interval": DATA_SOURCE_INTERVAL,
             },
-        })
-
-        event_name = await cache.get("event_name")
-        if event_name is not None:
+        }))
+        if "event_name" in cache:
             logger.info("Replaying latest state to new client")
-            await ws.send_json({"type": "event_name", "data": {"name": event_name}})
-            for dist_id in (await cache.get("all_dist_ids") or []):
-                dist = await cache.get(f"dist:{dist_id}")
-                if dist:
-                    await ws.send_json({"type": "distance_meta", "data": dist})
-            for race_id in (await cache.get("all_race_ids") or []):
-                comp = await cache.get(f"race:{race_id}")
-                if comp:
-                    await ws.send_json({"type": "competitor_update", "data": comp})
+            queue.put_nowait(_encode({"type": "snapshot", "data": _snapshot()}))
 
-    def disconnect(self, ws: WebSocket) -> None:
-        self.active = [c for c in self.active if c is not ws]
+        # no await between taking the snapshot and registering: every change made
+        # after the snapshot reaches this client as a broadcast
+        self.active[ws] = queue
+        self._writers[ws] = asyncio.create_task(self._writer(ws, queue))
+        logger.info("Client connected. Active: %d", len(self.active))
 
-    async def broadcast(self, msg: dict) -> None:
-        dead: list[WebSocket] = []
-        for ws in list(self.active):
+    def disconnect(self, ws: WebSocket) -> None:
+        self.active.pop(ws, None)
+        writer = self._writers.pop(ws, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    async def _writer(self, ws: WebSocket, queue: asyncio.Queue[bytes]) -> None:
+        try:
+            while True:
+                payload = await queue.get()
+                # hand the pre-encoded payload straight to the ASGI send channel
+                await asyncio.wait_for(
+                    ws.send({"type": "websocket.send", "bytes": payload}), timeout=SEND_TIMEOUT,
+                )
+        except Exception as e:
+            logger.warning("Send failed, dropping client: %s", repr(e))
+        finally:
+            # disconnected, failed or dropped as stalled — make sure the socket is closed
+            self.disconnect(ws)
+            with suppress(Exception):
+                await asyncio.wait_for(ws.close(code=1013), timeout=SEND_TIMEOUT)
+
+    def broadcast(self, msg: dict) -> None:
+        # serialize once, then only enqueue — the per-client writers do the sending
+        payload = _encode(msg)
+        stalled = []
+        for ws, queue in self.active.items():
             try:
-                await ws.send_json(msg)
-            except Exception as e:
-                logger.warning("Send failed, dropping client: %s", repr(e))
-                dead.append(ws)
-        for ws in dead:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                stalled.append(ws)
+        for ws in stalled:
+            logger.warning("Send queue full, dropping stalled client")
             self.disconnect(ws)
 
 
@@ -308,49 +573,90 @@ manager = ConnectionManager()
 
 # ── fetch loop ────────────────────────────────────────────────────────────────
 
+def _decode_and_process(content: bytes, prev: dict | None) -> dict:
+    return _process(orjson.loads(content), prev)
+
+
 POLLING_ACTIVE = True
 _upstream_user_agent: str | None = None
+# validators of the last successfully processed response, for conditional GETs
+_last_etag: str | None = None
+_last_modified: str | None = None
+# digest of the last successfully processed response body
+_last_raw_hash: bytes | None = None
 
 
 async def fetch_data_loop() -> None:
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    global _last_etag, _last_modified, _last_raw_hash
+    prev: dict | None = None
+    # keep the upstream connection alive across ticks (httpx drops idle
+    # connections after 5s by default, which is shorter than slow intervals)
+    limits = httpx.Limits(
+        max_keepalive_connections=4,
+        keepalive_expiry=max(30.0, DATA_SOURCE_INTERVAL * 3),
+    )
+    async with httpx.AsyncClient(timeout=10.0, limits=limits, http2=True) as client:
         while True:
             if not POLLING_ACTIVE:
                 await asyncio.sleep(0.5)
                 continue
             try:
                 headers = {"User-Agent": _upstream_user_agent} if _upstream_user_agent else {}
+                if _last_etag:
+                    headers["If-None-Match"] = _last_etag
+                if _last_modified:
+                    headers["If-Modified-Since"] = _last_modified
                 resp = await client.get(DATA_SOURCE_URL, headers=headers)
-                if resp.status_code == 200:
-                    raw = resp.json()
-                    curr = _process(raw)
-                    reset_detected, name_changed, dist_updates, comp_updates = await _update_cache_and_diff(curr)
+                raw_hash = (
+                    hashlib.blake2b(resp.content, digest_size=16).digest()
+                    if resp.status_code == 200 else None
+                )
+                if resp.status_code == 304 or (raw_hash is not None and raw_hash == _last_raw_hash):
+                    pass  # source unchanged since last processed response — skip processing
+                elif resp.status_code == 200:
+                    # JSON decoding and processing are CPU-bound — run them in a worker
+                    # thread so WebSocket sends and handshakes are not blocked meanwhile
+                    curr = await asyncio.to_thread(_decode_and_process, resp.content, prev)
+                    if curr is prev:
+                        reset_detected, name_changed, dist_updates, comp_updates = False, False, [], []
+                    else:
+                        reset_detected, name_changed, dist_updates, comp_updates = _update_cache_and_diff(curr)
 
                     if reset_detected:
                         logger.info("Broadcasting reset signal")
-                        await manager.broadcast({"type": "reset"})
+                        manager.broadcast({"type": "reset"})
 
                     if name_changed:
-                        await manager.broadcast({"type": "event_name", "data": {"name": curr["name"]}})
+                        manager.broadcast({"type": "event_name", "data": {"name": curr["name"]}})
 
-                    for dist in dist_updates:
-                        await manager.broadcast({"type": "distance_meta", "data": dist})
+                    msgs = [{"type": "distance_meta", "data": dist} for dist in dist_updates]
                     for comp in comp_updates:
                         logger.info(
                             "competitor_update: #%s %s — laps=%s total_time=%s (%s)",
-                            comp["start_number"],
-                            comp["name"],
-                            comp["laps_count"],
-                            comp["total_time"],
-                            comp["formatted_total_time"],
+                            comp.start_number,
+                            comp.name,
+                            comp.laps_count,
+                            comp.total_time,
+                            comp.formatted_total_time,
                         )
-                        await manager.broadcast({"type": "competitor_update", "data": comp})
+                    if comp_updates:
+                        msgs.append({"type": "competitor_updates", "data": comp_updates})
+
+                    for msg in msgs:
+                        manager.broadcast(msg)
 
                     if dist_updates or comp_updates or name_changed:
                         logger.info(
-                            "Broadcast: %d distance_meta, %d competitor_update",
+                            "Broadcast: %d distance_meta, %d competitors in competitor_updates",
                             len(dist_updates), len(comp_updates),
                         )
+
+                    # only now is this response fully applied — a failure above leaves
+                    # prev and the validators as they were, so the body is retried
+                    prev = curr
+                    _last_etag = resp.headers.get("ETag")
+                    _last_modified = resp.headers.get("Last-Modified")
+                    _last_raw_hash = raw_hash
                 else:
                     logger.warning("Fetch failed: HTTP %d", resp.status_code)
             except Exception as e:
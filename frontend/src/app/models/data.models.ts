@@ -42,6 +42,8 @@ export interface CompetitorUpdate {
   position_change: 'up' | 'down' | null;
   /** Set by frontend on receive for flash-update animation */
   lastUpdated?: number;
+  /** Computed by frontend on receive: total_time in seconds; null when no time */
+  total_seconds?: number | null;
   /** Computed by frontend grouping logic */
   group_number?: number | null;
   /** Computed by frontend grouping logic */
@@ -56,6 +58,13 @@ export interface CompetitorUpdate {
   remark: string | null;
 }
 
+/** snapshot message payload — full state replayed on connect in a single frame */
+export interface Snapshot {
+  name: string;
+  distances: DistanceMeta[];
+  competitors: CompetitorUpdate[];
+}
+
 // ── Frontend view state ───────────────────────────────────────────────────────
 
 /** Full local state for one distance, assembled from backend messages */
@@ -1,11 +1,13 @@
 import { Injectable, NgZone } from '@angular/core';
 import { TranslateService } from './translate.service';
+import { decodeMsgpack } from './msgpack';
 import { webSocket, WebSocketSubject } from 'rxjs/webSocket';
 import { BehaviorSubject, Subject } from 'rxjs';
 import {
   DistanceMeta,
   CompetitorUpdate,
   ProcessedDistance,
+  Snapshot,
   StandingsGroup,
 } from '../models/data.models';
 import { HttpClient } from '@angular/common/http';
@@ -185,7 +187,13 @@ export class DataService {
     if (this.socket$ && !this.socket$.closed) return;
     this._errors.next([]);
     this._status.next({ status: 'Connecting...', url: '', interval: null });
-    this.socket$ = webSocket({ url: this.BACKEND_URL, openObserver: { next: () => {} } });
+    this.socket$ = webSocket({
+      url: this.BACKEND_URL,
+      // backend sends msgpack-encoded binary frames
+      binaryType: 'arraybuffer',
+      deserializer: (e: MessageEvent) => decodeMsgpack(e.data as ArrayBuffer),
+      openObserver: { next: () => {} },
+    });
     this.socket$.subscribe({
       next: (msg: any) => this._enqueue(msg),
       error: (err: any) => this._handleError(err),
@@ -259,15 +267,32 @@ export class DataService {
       case 'reset':
         this._applyReset();
         return false;
+      case 'snapshot':
+        // Expand in place so the replay is still applied in time-sliced render cycles
+        this.queue.unshift(...this._expandSnapshot(msg.data as Snapshot));
+        return false;
       case 'distance_meta':
         return this._applyDistanceMeta(msg.data as DistanceMeta);
       case 'competitor_update':
         return this._applyCompetitorUpdate(msg.data as CompetitorUpdate);
+      case 'competitor_updates':
+        // One frame per fetch cycle; apply each competitor as its own queued update
+        this.queue.unshift(...(msg.data as CompetitorUpdate[]).map(data => ({ type: 'competitor_update', data })));
+        return false;
       default:
         return false;
     }
   }
 
+  /** Splits a connect-time snapshot into the equivalent per-entity messages, in replay order. */
+  private _expandSnapshot(snap: Snapshot): any[] {
+    return [
+      { type: 'event_name', data: { name: snap.name } },
+      ...snap.distances.map(data => ({ type: 'distance_meta', data })),
+      ...snap.competitors.map(data => ({ type: 'competitor_update', data })),
+    ];
+  }
+
   private _applyReset(): void {
     this.distanceMap.clear();
     this.competitorMap.clear();
@@ -310,6 +335,8 @@ export class DataService {
 
   private _applyCompetitorUpdate(comp: CompetitorUpdate): boolean {
     comp.lastUpdated = Date.now();
+    // Parse once on receive; sorting and grouping compare these many times per update
+    comp.total_seconds = comp.total_time ? this._parseSeconds(comp.total_time) : null;
     let distComps = this.competitorMap.get(comp.distance_id);
     if (!distComps) { distComps = new Map(); this.competitorMap.set(comp.distance_id, distComps); }
 
@@ -369,7 +396,7 @@ export class DataService {
       if (!a.total_time && !b.total_time) return 0;
       if (!a.total_time) return 1;
       if (!b.total_time) return -1;
-      return this._parseSeconds(a.total_time) - this._parseSeconds(b.total_time);
+      return a.total_seconds! - b.total_seconds!;
     });
     all.forEach((r, i) => {
       const newPos = i + 1;
@@ -383,9 +410,9 @@ export class DataService {
   }
 
 
-  private _timeDiff(a: string, b: string): number {
-    if (!a || !b) return 9999;
-    return Math.abs(this._parseSeconds(a) - this._parseSeconds(b));
+  private _timeDiff(a: CompetitorUpdate, b: CompetitorUpdate): number {
+    if (a.total_seconds == null || b.total_seconds == null) return 9999;
+    return Math.abs(a.total_seconds - b.total_seconds);
   }
 
   parseSeconds(t: string): number { return this._parseSeconds(t); }
@@ -420,7 +447,7 @@ export class DataService {
         groups.push(cur);
       } else if (
         r.laps_count === cur.laps &&
-        this._timeDiff(cur.races[cur.races.length - 1].total_time, r.total_time) <= threshold
+        this._timeDiff(cur.races[cur.races.length - 1], r) <= threshold
       ) {
         cur.races.push(r);
       } else {
@@ -429,7 +456,7 @@ export class DataService {
       }
     }
 
-    const leaderTime = groups[0]?.races[0]?.total_time ?? null;
+    const overallLeader = groups[0]?.races[0] ?? null;
 
     dist.standingsGroups = groups.map((group, gi) => {
       const gnum = gi + 1;
@@ -444,7 +471,7 @@ export class DataService {
             const diff = lapDiff > 0 ? lapDiff : 1;
             r.gap_to_above = `+${diff} ${this.ts.t(diff === 1 ? 'lapUnit' : 'lapsUnit')}`;
           } else {
-            r.gap_to_above = `+${this._timeDiff(leader.total_time, r.total_time).toFixed(3)}s`;
+            r.gap_to_above = `+${this._timeDiff(leader, r).toFixed(3)}s`;
           }
         }
       });
@@ -461,10 +488,10 @@ export class DataService {
           // Behind the leader by at least one lap: express gap in laps vs leader
           gapToGroupAhead = `+${lapDiff} ${this.ts.t(lapDiff === 1 ? 'lapUnit' : 'lapsUnit')}`;
         } else if (prevLast.total_time && first.total_time) {
-          gapToGroupAhead = `+${this._timeDiff(prevLast.total_time, first.total_time).toFixed(3)}s`;
+          gapToGroupAhead = `+${this._timeDiff(prevLast, first).toFixed(3)}s`;
         }
-        if (leaderTime && first.total_time) {
-          timeBehindLeader = `+${this._timeDiff(leaderTime, first.total_time).toFixed(3)}s`;
+        if (overallLeader?.total_time && first.total_time) {
+          timeBehindLeader = `+${this._timeDiff(overallLeader, first).toFixed(3)}s`;
         }
       }
 
@@ -501,7 +528,7 @@ export class DataService {
           if (lapDiff > 0) {
             r.gap_to_above = `+${lapDiff} ${this.ts.t(lapDiff === 1 ? 'lapUnit' : 'lapsUnit')}`;
           } else if (othersLeader?.total_time && r.total_time) {
-            r.gap_to_above = `+${this._timeDiff(othersLeader.total_time, r.total_time).toFixed(3)}s`;
+            r.gap_to_above = `+${this._timeDiff(othersLeader, r).toFixed(3)}s`;
           } else {
             r.gap_to_above = null;
           }
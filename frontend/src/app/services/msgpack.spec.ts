@@ -0,0 +1,93 @@
+import { decodeMsgpack } from './msgpack';
+
+/** Builds an ArrayBuffer from a list of byte values. */
+const buf = (...bytes: number[]) => new Uint8Array(bytes).buffer;
+
+/** Builds an ArrayBuffer from a type byte followed by a big-endian payload. */
+const typed = (t: number, size: number, write: (v: DataView) => void) => {
+  const out = new Uint8Array(1 + size);
+  out[0] = t;
+  write(new DataView(out.buffer, 1));
+  return out.buffer;
+};
+
+const concat = (...parts: (number[] | Uint8Array)[]) => {
+  const out: number[] = [];
+  for (const p of parts) out.push(...p);
+  return new Uint8Array(out).buffer;
+};
+
+const utf8 = (s: string) => new TextEncoder().encode(s);
+
+describe('decodeMsgpack', () => {
+  it('decodes positive and negative fixints', () => {
+    expect(decodeMsgpack(buf(0x00))).toBe(0);
+    expect(decodeMsgpack(buf(0x7f))).toBe(127);
+    expect(decodeMsgpack(buf(0xe0))).toBe(-32);
+    expect(decodeMsgpack(buf(0xff))).toBe(-1);
+  });
+
+  it('decodes nil and booleans', () => {
+    expect(decodeMsgpack(buf(0xc0))).toBeNull();
+    expect(decodeMsgpack(buf(0xc2))).toBe(false);
+    expect(decodeMsgpack(buf(0xc3))).toBe(true);
+  });
+
+  it('decodes unsigned ints', () => {
+    expect(decodeMsgpack(buf(0xcc, 0xff))).toBe(255);
+    expect(decodeMsgpack(buf(0xcd, 0x01, 0x00))).toBe(256);
+    expect(decodeMsgpack(buf(0xce, 0x00, 0x01, 0x00, 0x00))).toBe(65536);
+    expect(decodeMsgpack(typed(0xcf, 8, (v) => v.setBigUint64(0, 2n ** 40n)))).toBe(2 ** 40);
+  });
+
+  it('decodes signed ints', () => {
+    expect(decodeMsgpack(buf(0xd0, 0x80))).toBe(-128);
+    expect(decodeMsgpack(typed(0xd1, 2, (v) => v.setInt16(0, -300)))).toBe(-300);
+    expect(decodeMsgpack(typed(0xd2, 4, (v) => v.setInt32(0, -70000)))).toBe(-70000);
+    expect(decodeMsgpack(typed(0xd3, 8, (v) => v.setBigInt64(0, -(2n ** 40n))))).toBe(-(2 ** 40));
+  });
+
+  it('decodes floats', () => {
+    expect(decodeMsgpack(typed(0xca, 4, (v) => v.setFloat32(0, 1.5)))).toBe(1.5);
+    expect(decodeMsgpack(typed(0xcb, 8, (v) => v.setFloat64(0, 12.345)))).toBe(12.345);
+  });
+
+  it('decodes strings of every length class', () => {
+    expect(decodeMsgpack(concat([0xa3], utf8('abc')))).toBe('abc');
+    expect(decodeMsgpack(concat([0xa2], utf8('é')))).toBe('é');
+    const s40 = 'x'.repeat(40);
+    expect(decodeMsgpack(concat([0xd9, 40], utf8(s40)))).toBe(s40);
+    const s300 = 'y'.repeat(300);
+    expect(decodeMsgpack(concat([0xda, 0x01, 0x2c], utf8(s300)))).toBe(s300);
+    const s70k = 'z'.repeat(70000);
+    expect(decodeMsgpack(concat([0xdb, 0x00, 0x01, 0x11, 0x70], utf8(s70k)))).toBe(s70k);
+  });
+
+  it('decodes binary of every length class', () => {
+    expect(decodeMsgpack(buf(0xc4, 2, 1, 2))).toEqual(new Uint8Array([1, 2]));
+    expect(decodeMsgpack(buf(0xc5, 0x00, 0x01, 9))).toEqual(new Uint8Array([9]));
+    expect(decodeMsgpack(buf(0xc6, 0x00, 0x00, 0x00, 0x01, 7))).toEqual(new Uint8Array([7]));
+  });
+
+  it('decodes arrays of every length class', () => {
+    expect(decodeMsgpack(buf(0x92, 0x01, 0xc3))).toEqual([1, true]);
+    expect(decodeMsgpack(buf(0xdc, 0x00, 0x02, 0x01, 0x02))).toEqual([1, 2]);
+    expect(decodeMsgpack(buf(0xdd, 0x00, 0x00, 0x00, 0x01, 0xc0))).toEqual([null]);
+  });
+
+  it('decodes maps of every length class', () => {
+    expect(decodeMsgpack(concat([0x81, 0xa1], utf8('a'), [0x01]))).toEqual({ a: 1 });
+    expect(decodeMsgpack(concat([0xde, 0x00, 0x01, 0xa1], utf8('b'), [0x92, 0x01, 0x02]))).toEqual({
+      b: [1, 2],
+    });
+    expect(decodeMsgpack(concat([0xdf, 0x00, 0x00, 0x00, 0x01, 0xa1], utf8('c'), [0x80]))).toEqual({
+      c: {},
+    });
+  });
+
+  it('rejects extension types', () => {
+    expect(() => decodeMsgpack(buf(0xd4, 0x01, 0x00))).toThrow('Unsupported msgpack type 0xd4');
+    expect(() => decodeMsgpack(buf(0xc7, 0x00, 0x01))).toThrow('Unsupported msgpack type 0xc7');
+    expect(() => decodeMsgpack(buf(0xc1))).toThrow('Unsupported msgpack type 0xc1');
+  });
+});
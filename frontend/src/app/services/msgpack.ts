@@ -0,0 +1,90 @@
+const utf8 = new TextDecoder();
+
+/**
+ * Decodes one msgpack value, as sent by the backend in each WebSocket frame.
+ * Supports every type the backend encoder emits (nil, bool, int, float, str,
+ * bin, array, map); extension types are rejected.
+ */
+export function decodeMsgpack(buf: ArrayBuffer): any {
+  const view = new DataView(buf);
+  const bytes = new Uint8Array(buf);
+  let pos = 0;
+
+  const u8 = () => view.getUint8(pos++);
+  const u16 = () => {
+    const v = view.getUint16(pos);
+    pos += 2;
+    return v;
+  };
+  const u32 = () => {
+    const v = view.getUint32(pos);
+    pos += 4;
+    return v;
+  };
+  const str = (n: number) => {
+    const s = utf8.decode(bytes.subarray(pos, pos + n));
+    pos += n;
+    return s;
+  };
+  const bin = (n: number) => {
+    const b = bytes.slice(pos, pos + n);
+    pos += n;
+    return b;
+  };
+  const arr = (n: number) => {
+    const a = new Array(n);
+    for (let i = 0; i < n; i++) a[i] = read();
+    return a;
+  };
+  const map = (n: number) => {
+    const o: Record<string, any> = {};
+    for (let i = 0; i < n; i++) {
+      const key = read();
+      o[key] = read();
+    }
+    return o;
+  };
+  /** Reads a fixed-size value at pos, then skips past it. */
+  const fixed = <T>(size: number, get: () => T) => {
+    const v = get();
+    pos += size;
+    return v;
+  };
+
+  function read(): any {
+    const t = bytes[pos++];
+    if (t < 0x80) return t; // positive fixint
+    if (t < 0x90) return map(t & 0x0f);
+    if (t < 0xa0) return arr(t & 0x0f);
+    if (t < 0xc0) return str(t & 0x1f);
+    if (t >= 0xe0) return t - 0x100; // negative fixint
+    switch (t) {
+      case 0xc0: return null;
+      case 0xc2: return false;
+      case 0xc3: return true;
+      case 0xc4: return bin(u8());
+      case 0xc5: return bin(u16());
+      case 0xc6: return bin(u32());
+      case 0xca: return fixed(4, () => view.getFloat32(pos));
+      case 0xcb: return fixed(8, () => view.getFloat64(pos));
+      case 0xcc: return u8();
+      case 0xcd: return u16();
+      case 0xce: return u32();
+      case 0xcf: return fixed(8, () => Number(view.getBigUint64(pos)));
+      case 0xd0: return fixed(1, () => view.getInt8(pos));
+      case 0xd1: return fixed(2, () => view.getInt16(pos));
+      case 0xd2: return fixed(4, () => view.getInt32(pos));
+      case 0xd3: return fixed(8, () => Number(view.getBigInt64(pos)));
+      case 0xd9: return str(u8());
+      case 0xda: return str(u16());
+      case 0xdb: return str(u32());
+      case 0xdc: return arr(u16());
+      case 0xdd: return arr(u32());
+      case 0xde: return map(u16());
+      case 0xdf: return map(u32());
+      default: throw new Error(`Unsupported msgpack type 0x${t.toString(16)}`);
+    }
+  }
+
+  return read();
+}
@@ -6,14 +6,15 @@ Stops after the last file (holds last state). POST /api/reset restarts from the
 """
 
 import asyncio
-import json
+import hashlib
 import logging
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 log = logging.getLogger(__name__)
@@ -21,8 +22,15 @@ log = logging.getLogger(__name__)
 DATA_SAMPLE_DIRECTORY = os.environ.get("DATA_SAMPLE_DIRECTORY", "")  # e.g. "data/2026-03-01/"
 DATA_SAMPLE_INTERVAL = float(os.environ.get("DATA_SAMPLE_INTERVAL", "5"))
 
-_state: dict = {}
+
+def _etag_for(payload: bytes) -> str:
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+_payload: bytes = b"{}"  # current sample, serialized once when it is loaded
+_etag: str = _etag_for(_payload)
 _replay_task: asyncio.Task | None = None
+_loaded: dict[Path, tuple[int, bytes, str]] = {}  # sample path → (mtime_ns, body, ETag)
 
 
 def _sample_files() -> list[Path]:
@@ -30,20 +38,42 @@ def _sample_files() -> list[Path]:
     return sorted(base.glob("*.json"))
 
 
+def _load_sample(path: Path) -> tuple[bytes, str]:
+    """
+    Read one sample and return its response body and ETag. Loaded samples are
+    kept, so a replay after /api/reset only reads files that changed on disk.
+    """
+    mtime = path.stat().st_mtime_ns
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    # re-encode compactly (UTF-8, no whitespace), once per sample instead of per request
+    payload = orjson.dumps(orjson.loads(path.read_bytes()))
+    etag = _etag_for(payload)
+    _loaded[path] = (mtime, payload, etag)
+    return payload, etag
+
+
 async def _replay_loop() -> None:
-    global _state
+    global _payload, _etag
     files = _sample_files()
     if not files:
         log.error("Replay: no JSON files found in %s", Path(__file__).parent / DATA_SAMPLE_DIRECTORY)
         return
     log.info("Replay: %d files, interval=%.1fs", len(files), DATA_SAMPLE_INTERVAL)
+    loop = asyncio.get_running_loop()
+    next_at = loop.time()
     for i, path in enumerate(files, 1):
-        _state = json.loads(path.read_text())
+        # file I/O, parsing and encoding are blocking — keep them off the event loop
+        _payload, _etag = await asyncio.to_thread(_load_sample, path)
         log.info("Replay: loaded %s (%d/%d)", path.name, i, len(files))
-        await asyncio.sleep(DATA_SAMPLE_INTERVAL)
-    log.info("Replay complete — broadcasting last sample indefinitely")
-    while True:
-        await asyncio.sleep(DATA_SAMPLE_INTERVAL)
+        # samples are due on a fixed timeline, so load time does not add up as drift;
+        # a load that overran the interval is followed by the next sample right away
+        next_at = max(next_at + DATA_SAMPLE_INTERVAL, loop.time())
+        await asyncio.sleep(next_at - loop.time())
+    # nothing left to advance — end the task instead of waking up every interval;
+    # _payload keeps serving the last sample until /api/reset starts a new replay
+    log.info("Replay complete — serving last sample until reset")
 
 
 @asynccontextmanager
@@ -58,8 +88,12 @@ app = FastAPI(title="Live Results Mock Server", lifespan=lifespan)
 
 
 @app.get("/api/data")
-async def get_data():
-    return JSONResponse(content=_state)
+async def get_data(request: Request):
+    # pollers that send back the ETag of the sample they already have get an empty 304
+    headers = {"ETag": _etag}
+    if request.headers.get("if-none-match") == _etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=_payload, media_type="application/json", headers=headers)
 
 
 @app.post("/api/reset")